@@ -1,8 +1,19 @@
+import bisect
+import itertools
 import os
+import shutil
+import time
+from array import array
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog, messagebox
 from PIL import Image, ImageTk
 
+def _is_nonempty(path):
+    """True if the directory has at least one entry, without listing all of it."""
+    with os.scandir(path) as it:
+        return any(True for _ in it)
+
 class ImageReviewer:
     def __init__(self, root):
         self.root = root
@@ -11,12 +22,8 @@ class ImageReviewer:
         self.root.minsize(800, 600)
         self.root.focus_force()
 
-        # Image display
-        self.image_label = tk.Label(root, bg="black", takefocus=True)
-        self.image_label.pack(expand=True, fill="both")
-        self.image_label.focus_set()
-
-        # Stats bar
+        # Stats bar — packed first so pack reserves its space before the image
+        # label, which may request more than fits after the window shrinks
         self.stats_label = tk.Label(
             root,
             text="",
@@ -26,32 +33,58 @@ class ImageReviewer:
         )
         self.stats_label.pack(side="bottom", fill="x", pady=12)
 
+        # Image display
+        self.image_label = tk.Label(root, bg="black", takefocus=True)
+        self.image_label.pack(expand=True, fill="both")
+        self.image_label.focus_set()
+
         # Data
         self.folder = None
         self.deleted_folder = None
         self.image_paths = []
+        self._basenames = []        # Parallel to image_paths, built once per folder
+        self._deleted_paths = []    # Where each image lands in _deleted
+        self._scan = None           # Generator over the rest of the folder while it is being listed
+        self._seen_paths = set()    # Everything in image_paths, to drop entries the scan sees twice
         self.index = 0
         self.deleted_count = 0
         self.kept_count = 0
-        self.history = []           # For undo (Z key)
-        self.current_photo = None
-
-        # Key bindings — use root.bind_all with proper event names for reliability
-        self.root.bind_all("<Key-a>", self.delete_image)
-        self.root.bind_all("<Key-A>", self.delete_image)
-        self.root.bind_all("<Key-d>", self.keep_image)
-        self.root.bind_all("<Key-D>", self.keep_image)
-        self.root.bind_all("<Left>", self.delete_image)
-        self.root.bind_all("<Right>", self.keep_image)
-        self.root.bind_all("<Key-z>", self.go_back)
-        self.root.bind_all("<Key-Z>", self.go_back)
-        self.root.bind_all("<BackSpace>", self.go_back)
+        # Undo history (Z key), one column per field rather than a tuple per action
+        self._hist_kind = bytearray()   # 0 = keep, 1 = delete
+        self._hist_src = []             # Path the action was taken on
+        self._hist_dst = []             # Path in _deleted once the move settles, else None
+        self._hist_idx = array("q")     # index at the time of the action
+        self._deleted_idx = set()   # Indices moved to _deleted; image_paths itself never shrinks
+        self.current_photo = None   # One PhotoImage reused across renders
+        self._canvas = None         # Black PIL backdrop the same size as current_photo
+        self._resize_pending = None
+        self._last_render_key = None    # (id(current_original), w, h) last rendered
+        self._last_resample = None      # Filter used for that render
+        self._reduced = None        # current_original box-reduced by _reduced_factor
+        self._reduced_factor = 0
+        self._pool = ThreadPoolExecutor(max_workers=2)  # Decodes upcoming images
+        self._prefetch = {}         # path -> Future of decoded image
+        self._io = ThreadPoolExecutor(max_workers=1)  # Single worker keeps moves in order
+        self._pending_moves = {}    # History position -> rename future not yet settled
+        self._move_poll = None      # Pending after() id for _poll_moves
+
+        # Key bindings — one root.bind_all dispatcher that switches on keysym
+        self.root.bind_all("<Key>", self._on_key)
 
         self.root.bind("<Configure>", self.on_resize)
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
         self.select_folder()
 
+    def _on_key(self, ev):
+        ks = ev.keysym
+        if ks in ("a", "A", "Left"):
+            return self.delete_image(ev)
+        if ks in ("d", "D", "Right"):
+            return self.keep_image(ev)
+        if ks in ("z", "Z", "BackSpace"):
+            return self.go_back(ev)
+
     def select_folder(self):
         self.folder = filedialog.askdirectory(title="Select Folder with Images")
         if not self.folder:
@@ -62,38 +95,94 @@ class ImageReviewer:
         if not os.path.exists(self.deleted_folder):
             os.makedirs(self.deleted_folder)
 
-        exts = (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp", ".tiff", ".heic", ".svg")
-        self.image_paths = [
-            os.path.join(self.folder, f)
-            for f in os.listdir(self.folder)
-            if f.lower().endswith(exts)
-        ]
-        self.image_paths.sort(key=str.lower)
-
-        if not self.image_paths:
+        # Paint the first image as soon as one turns up; _finish_scan lists the rest
+        self._scan = self._scan_images()
+        first = next(self._scan, None)
+        if first is None:
+            self._scan = None
             self.image_label.config(text="No images found in this folder!", fg="red")
             return
 
+        self._insert_path(0, first)
         self.show_image()
         self.update_stats()
+        self.root.after(1, self._finish_scan)
 
         # Extra focus
         self.root.lift()
         self.root.focus_force()
         self.image_label.focus_set()
 
+    def _scan_images(self):
+        exts = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp", ".tiff", ".heic", ".svg"}
+        with os.scandir(self.folder) as it:
+            for e in it:
+                if e.is_file(follow_symlinks=False) and os.path.splitext(e.name)[1].lower() in exts:
+                    yield e.path
+
+    def _finish_scan(self, batch_size=500):
+        batch = list(itertools.islice(self._scan, batch_size))
+        was_done = self.index >= len(self.image_paths)
+
+        # Only slot new paths in ahead of the cursor so indices already in
+        # _hist_idx and _deleted_idx stay valid; the unseen tail stays sorted
+        lo = min(self.index + 1, len(self.image_paths))
+        for path in batch:
+            # Delete + undo re-creates the file mid-scan, and readdir may then return it again
+            if path in self._seen_paths:
+                continue
+            i = bisect.bisect_right(self.image_paths, path.casefold(), lo=lo, key=str.casefold)
+            self._insert_path(i, path)
+
+        if len(batch) == batch_size:
+            self.root.after(1, self._finish_scan)
+        else:
+            self._scan = None
+
+        if was_done and self.index < len(self.image_paths):
+            self.show_image()
+        elif batch and not was_done:
+            self._schedule_prefetch()
+        self.update_stats()
+
+    def _insert_path(self, index, path):
+        basename = os.path.basename(path)
+        self.image_paths.insert(index, path)
+        self._seen_paths.add(path)
+        self._basenames.insert(index, basename)
+        self._deleted_paths.insert(index, os.path.join(self.deleted_folder, basename))
+
     def show_image(self):
+        # Release the previous image's pixel buffer now rather than whenever GC gets to it
+        for prev in (getattr(self, "current_original", None), self._reduced):
+            if prev is not None:
+                try:
+                    prev.close()
+                except Exception:
+                    pass
+        self.current_original = None
+        self._reduced = None
+        self._reduced_factor = 0
+
+        while self.index in self._deleted_idx:
+            self.index += 1
+
         if self.index >= len(self.image_paths):
             self.image_label.config(image="", text="All done!\nClose the window when ready.", fg="lime")
-            self.current_photo = None  # Clear reference
-            if hasattr(self, 'current_original'):
-                del self.current_original  # Clear original
+            self.current_photo = None  # Drop Tk pixmap too
+            self._canvas = None
             self.update_stats()
             return
 
         path = self.image_paths[self.index]
+        self._last_render_key = None
+        fut = self._prefetch.pop(path, None)
         try:
-            img = Image.open(path).convert("RGB")
+            # cancel() fails once the worker has started, so reuse its result
+            if fut is not None and not fut.cancel():
+                img = fut.result()
+            else:
+                img = self.load_image(path, self.target_size())
             self.current_original = img
             self.render_resized_image()
         except Exception as e:
@@ -101,64 +190,158 @@ class ImageReviewer:
             self.delete_image()  # move broken files to _deleted
             return
 
+        self._schedule_prefetch()
         self.image_label.focus_set()
 
-    def delete_image(self):
+    def target_size(self):
+        # Largest area the image can ever be shown in, so a later maximise still has
+        # enough pixels to fill the window
+        return self.root.winfo_screenwidth(), self.root.winfo_screenheight() - 100
+
+    @staticmethod
+    def load_image(path, size):
+        img = Image.open(path)
+        # Let libjpeg decode at 1/2, 1/4 or 1/8 scale instead of full resolution.
+        # draft() only scales down while both sides still cover the requested box,
+        # so ask for the fit-inside size rather than the whole area
+        w, h = size
+        ow, oh = img.size
+        ratio = min(w / ow, h / oh)
+        if img.format in ("JPEG", "MPO") and w >= 50 and h >= 50 and ratio < 1:
+            img.draft("RGB", (max(1, round(ow * ratio)), max(1, round(oh * ratio))))
+        return img.convert("RGB")
+
+    def _schedule_prefetch(self):
+        upcoming = self.image_paths[self.index + 1:self.index + 3]
+
+        # Drop anything no longer just ahead of us (deleted, undone, skipped past)
+        for path in list(self._prefetch):
+            if path not in upcoming:
+                self._discard_prefetch(self._prefetch.pop(path))
+
+        size = self.target_size()  # Tk calls must stay on the main thread
+        for path in upcoming:
+            if path not in self._prefetch:
+                self._prefetch[path] = self._pool.submit(self.load_image, path, size)
+
+    @staticmethod
+    def _discard_prefetch(fut):
+        # A decode that already started holds (or will hold) pixel data nobody else
+        # references; close it like show_image does, once it is done
+        if not fut.cancel():
+            fut.add_done_callback(lambda f: f.exception() is None and f.result().close())
+
+    def delete_image(self, event=None):
         print("Delete key pressed")  # Debug to confirm key event
         if self.index >= len(self.image_paths):
             return "break"
 
         original_path = self.image_paths[self.index]
-        basename = os.path.basename(original_path)
-        deleted_path = os.path.join(self.deleted_folder, basename)
-        try:
-            os.rename(original_path, deleted_path)
-            print(f"Moved to _deleted: {basename}")
-            self.history.append(("delete", deleted_path, original_path))
-            self.deleted_count += 1
-        except Exception as e:
-            print(f"Move failed {original_path}: {e}")
-
-        del self.image_paths[self.index]
+        deleted_path = self._deleted_paths[self.index]
+        # Move off the Tk thread so the next image paints without waiting on the disk
+        fut = self._io.submit(self.move_to_deleted, original_path, deleted_path)
+        self._pending_moves[len(self._hist_kind)] = fut
+        if self._move_poll is None:
+            self._move_poll = self.root.after(50, self._poll_moves)
+        self._hist_kind.append(1)
+        self._hist_src.append(original_path)
+        self._hist_dst.append(None)     # Filled in by _settle_moves
+        self._hist_idx.append(self.index)
+        self.deleted_count += 1
+
+        self._deleted_idx.add(self.index)
+        self.index += 1
         self.show_image()
         self.update_stats()
         return "break"
 
-    def keep_image(self):
+    @staticmethod
+    def move_to_deleted(src, dst):
+        """Move src into _deleted without clobbering a same-named file; returns the final path."""
+        if os.path.exists(dst):
+            stem, ext = os.path.splitext(dst)
+            dst = f"{stem}_{int(time.time() * 1000)}{ext}"
+        os.replace(src, dst)
+        return dst
+
+    def _poll_moves(self):
+        self._move_poll = None
+        if self._settle_moves():
+            self.update_stats()
+        if self._pending_moves:
+            self._move_poll = self.root.after(50, self._poll_moves)
+
+    def _settle_moves(self, wait=False):
+        """Apply finished renames on the Tk thread; returns True if any were settled."""
+        settled = False
+        # Highest position first, so dropping an entry only shifts ones still pending
+        for pos in sorted(self._pending_moves, reverse=True):
+            fut = self._pending_moves[pos]
+            if not (wait or fut.done()):
+                continue
+            del self._pending_moves[pos]
+            settled = True
+
+            basename = self._basenames[self._hist_idx[pos]]
+            err = fut.exception()
+            if err is None:
+                self._hist_dst[pos] = fut.result()
+                print(f"Moved to _deleted: {basename}")
+                continue
+
+            # Like a failed synchronous move: the image stays skipped but is
+            # neither counted nor undoable
+            print(f"Move failed {self._hist_src[pos]}: {err}")
+            del self._hist_kind[pos]
+            del self._hist_src[pos]
+            del self._hist_dst[pos]
+            del self._hist_idx[pos]
+            self.deleted_count -= 1
+            self._pending_moves = {p - 1 if p > pos else p: f for p, f in self._pending_moves.items()}
+        return settled
+
+    def keep_image(self, event=None):
         print("Keep key pressed")  # Debug
         if self.index >= len(self.image_paths):
             return "break"
 
         path = self.image_paths[self.index]
-        self.history.append(("keep", path))
+        self._hist_kind.append(0)
+        self._hist_src.append(path)
+        self._hist_dst.append(None)
+        self._hist_idx.append(self.index)
         self.kept_count += 1
-        print(f"Kept: {os.path.basename(path)}")
+        print(f"Kept: {self._basenames[self.index]}")
 
         self.index += 1
         self.show_image()
         self.update_stats()
         return "break"
 
-    def go_back(self):
+    def go_back(self, event=None):
         print("Undo key pressed")  # Debug
-        if not self.history:
+        # Failed moves drop out of history, so settle them before picking what to undo
+        self._settle_moves(wait=True)
+        if not self._hist_kind:
+            self.update_stats()
             return "break"
 
-        action_tup = self.history.pop()
-        if action_tup[0] == "delete":
-            deleted_path, original_path = action_tup
+        kind = self._hist_kind.pop()
+        original_path = self._hist_src.pop()
+        deleted_path = self._hist_dst.pop()
+        prev_index = self._hist_idx.pop()
+        if kind == 1:
             try:
-                os.rename(deleted_path, original_path)
-                print(f"Undo delete: Restored {os.path.basename(original_path)}")
+                os.replace(deleted_path, original_path)
+                print(f"Undo delete: Restored {self._basenames[prev_index]}")
             except Exception as e:
                 print(f"Restore failed: {e}")
-            self.image_paths.insert(self.index, original_path)
+            self._deleted_idx.discard(prev_index)
             self.deleted_count -= 1
         else:
-            path = action_tup
             self.kept_count -= 1
-            self.index = max(0, self.index - 1)
-            print(f"Undo keep: Going back to {os.path.basename(path)}")
+            print(f"Undo keep: Going back to {self._basenames[prev_index]}")
+        self.index = prev_index
 
         self.show_image()
         self.update_stats()
@@ -173,9 +356,22 @@ class ImageReviewer:
     def on_resize(self, event=None):
         if event and event.widget != self.root:
             return
-        self.render_resized_image()
+        # Moves and focus/stacking changes also fire Configure; nothing to redo then
+        w = self.root.winfo_width()
+        h = self.root.winfo_height() - 100
+        if (id(getattr(self, "current_original", None)), w, h) == self._last_render_key:
+            return
+        # Cheap filter while dragging, full-quality render once resizing settles
+        self.render_resized_image(Image.Resampling.HAMMING)
+        if self._resize_pending:
+            self.root.after_cancel(self._resize_pending)
+        self._resize_pending = self.root.after(80, self._final_render)
+
+    def _final_render(self):
+        self._resize_pending = None
+        self.render_resized_image(Image.Resampling.LANCZOS)
 
-    def render_resized_image(self):
+    def render_resized_image(self, resample=Image.Resampling.LANCZOS):
         if not hasattr(self, "current_original") or self.current_original is None:
             return
 
@@ -184,23 +380,68 @@ class ImageReviewer:
         if w < 50 or h < 50:
             return
 
-        img = self.current_original.copy()
-        img.thumbnail((w, h), Image.Resampling.LANCZOS)
-        self.current_photo = ImageTk.PhotoImage(img)
-        self.image_label.config(image=self.current_photo)
+        # Already rendered at this size: a HAMMING preview would only lower the
+        # quality, and the same filter again would change nothing
+        key = (id(self.current_original), w, h)
+        if key == self._last_render_key and (
+            resample == Image.Resampling.HAMMING or resample == self._last_resample
+        ):
+            return
+
+        # Same fit-inside, never-upscale size thumbnail() would pick, but resize()
+        # already returns a new image so the full-res copy() is unnecessary
+        ow, oh = self.current_original.size
+        ratio = min(w / ow, h / oh, 1.0)
+        size = (max(1, round(ow * ratio)), max(1, round(oh * ratio)))
+        src = self.current_original
+        factor = min(ow // size[0], oh // size[1])
+        if factor >= 2:
+            # Box-reduce by the integer part once and keep it, so drag resizes only
+            # filter the small remainder instead of re-reading the full original
+            if self._reduced is None or self._reduced_factor != factor:
+                self._reduced = src.reduce(factor)
+                self._reduced_factor = factor
+            src = self._reduced
+        # reducing_gap box-reduces first on large downscales, then runs the real filter
+        img = src.resize(size, resample, reducing_gap=2.0)
+
+        # Paste into the existing PhotoImage so Tk keeps the same image bound to the
+        # label; only reallocate when the window outgrows it
+        if self.current_photo is None or w > self._canvas.width or h > self._canvas.height:
+            cw = max(w, self._canvas.width if self._canvas else 0)
+            ch = max(h, self._canvas.height if self._canvas else 0)
+            self._canvas = Image.new("RGB", (cw, ch))
+            self.current_photo = ImageTk.PhotoImage("RGB", (cw, ch))
+            self.image_label.config(image=self.current_photo)
+        else:
+            self._canvas.paste((0, 0, 0), (0, 0) + self._canvas.size)
+
+        # The label centres the backdrop, so centring on it keeps the image centred
+        self._canvas.paste(img, ((self._canvas.width - img.width) // 2, (self._canvas.height - img.height) // 2))
+        self.current_photo.paste(self._canvas)
+        self._last_render_key = key
+        self._last_resample = resample
 
     def on_closing(self):
-        delete_folder = False
-        if self.deleted_folder and os.path.exists(self.deleted_folder) and os.listdir(self.deleted_folder):
-            delete_folder = messagebox.askyesno("Permanently Delete", "Delete the _deleted folder permanently?")
-            if delete_folder:
-                try:
-                    import shutil
-                    shutil.rmtree(self.deleted_folder)
-                except Exception as e:
-                    messagebox.showerror("Error", f"Could not delete folder: {e}")
+        self._settle_moves(wait=True)
+
+        rmtree_fut = None
+        if self.deleted_folder and os.path.exists(self.deleted_folder) and _is_nonempty(self.deleted_folder):
+            if messagebox.askyesno("Permanently Delete", "Delete the _deleted folder permanently?"):
+                # Runs on the I/O worker so the Quit prompt comes up straight away
+                rmtree_fut = self._io.submit(shutil.rmtree, self.deleted_folder)
+
+        quit_app = messagebox.askokcancel("Quit", "Are you sure you want to exit?")
+
+        if rmtree_fut is not None:
+            try:
+                rmtree_fut.result()
+            except Exception as e:
+                messagebox.showerror("Error", f"Could not delete folder: {e}")
 
-        if messagebox.askokcancel("Quit", "Are you sure you want to exit?"):
+        if quit_app:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._io.shutdown(wait=True)
             self.root.quit()
             self.root.destroy()
 
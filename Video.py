@@ -21,7 +21,9 @@ Requirements:
 import os
 import sys
 import shutil
+import time
 import tkinter as tk
+from array import array
 from tkinter import filedialog, messagebox
 
 try:
@@ -34,6 +36,12 @@ except Exception as exc:
     )
 
 
+def _is_nonempty(path):
+    """True if the directory has at least one entry, without listing all of it."""
+    with os.scandir(path) as it:
+        return any(True for _ in it)
+
+
 class VideoReviewer:
     def __init__(self, root):
         self.root = root
@@ -86,37 +94,36 @@ class VideoReviewer:
         self.seek_bar.pack(side="bottom", fill="x")
 
         self.user_is_seeking = False
+        self._seek_dirty = False      # Drag moved the bar since the last set_position
+        self._seek_after = None       # Pending drag flush timer
+        self._last_pos_set = -1       # Last position sent to (or read from) VLC
 
         # Mouse-based seeking
         self.seek_bar.bind("<ButtonPress-1>", self.on_seek_click)
         self.seek_bar.bind("<B1-Motion>", self.start_seek)
         self.seek_bar.bind("<ButtonRelease-1>", self.end_seek)
 
-        # --- VLC setup ---
-        self.vlc_instance = vlc.Instance()
-        self.media_player = self.vlc_instance.media_player_new()
+        # --- VLC setup (deferred to _ensure_vlc; loading plugins is slow) ---
+        self.vlc_instance = None
+        self.media_player = None
 
         # Data
         self.folder = None
         self.deleted_folder = None
         self.video_paths = []
+        self._basenames = []        # Kept parallel to video_paths
+        self._deleted_paths = []
         self.index = 0
         self.deleted_count = 0
         self.kept_count = 0
-        self.history = []
+        # Undo history, one column per field rather than a tuple per action
+        self._hist_kind = bytearray()   # 0 = keep, 1 = delete
+        self._hist_src = []             # Original path of the video
+        self._hist_dst = []             # Path in _deleted, None for keeps
+        self._hist_idx = array("q")     # index at the time of the action
 
         # Key bindings
-        self.root.bind_all("<Key-a>", self.delete_video)
-        self.root.bind_all("<Key-A>", self.delete_video)
-        self.root.bind_all("<Key-d>", self.keep_video)
-        self.root.bind_all("<Key-D>", self.keep_video)
-        self.root.bind_all("<Key-p>", self.play_pause_video)
-        self.root.bind_all("<Key-P>", self.play_pause_video)
-        self.root.bind_all("<Left>", self.delete_video)
-        self.root.bind_all("<Right>", self.keep_video)
-        self.root.bind_all("<Key-z>", self.go_back)
-        self.root.bind_all("<Key-Z>", self.go_back)
-        self.root.bind_all("<BackSpace>", self.go_back)
+        self.root.bind_all("<Key>", self._on_key)
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
@@ -126,6 +133,17 @@ class VideoReviewer:
         # Ask for folder
         self.select_folder()
 
+    def _on_key(self, ev):
+        ks = ev.keysym
+        if ks in ("a", "A", "Left"):
+            return self.delete_video(ev)
+        if ks in ("d", "D", "Right"):
+            return self.keep_video(ev)
+        if ks in ("z", "Z", "BackSpace"):
+            return self.go_back(ev)
+        if ks in ("p", "P"):
+            return self.play_pause_video(ev)
+
     # ---------------- SEEKING LOGIC ---------------- #
 
     def on_seek_click(self, event):
@@ -143,11 +161,24 @@ class VideoReviewer:
         self.user_is_seeking = True
 
     def start_seek(self, event=None):
-        """User is dragging the slider."""
+        """User is dragging the slider — batch the motion into one seek every 50ms."""
         self.user_is_seeking = True
+        self._seek_dirty = True
+        if self._seek_after is None:
+            self._seek_after = self.root.after(50, self._flush_seek)
+
+    def _flush_seek(self):
+        self._seek_after = None
+        if self._seek_dirty:
+            self._seek_dirty = False
+            self.apply_seek()
 
     def end_seek(self, event=None):
         """User stopped dragging — apply change."""
+        if self._seek_after is not None:
+            self.root.after_cancel(self._seek_after)
+            self._seek_after = None
+        self._seek_dirty = False
         self.user_is_seeking = False
         self.apply_seek()
 
@@ -159,23 +190,32 @@ class VideoReviewer:
 
     def apply_seek(self):
         """Convert seek bar 0–1000 range to VLC position."""
+        if self.media_player is None:
+            return
         try:
             pos = float(self.seek_var.get()) / 1000.0
+            if abs(pos - self._last_pos_set) < 0.005:
+                return
             self.media_player.set_position(pos)
+            self._last_pos_set = pos
         except:
             pass
 
     def update_seek_bar(self):
         """Poll video position and update bar when not being dragged."""
+        playing = False
         try:
-            if not self.user_is_seeking and self.media_player.is_playing():
+            playing = self.media_player is not None and self.media_player.is_playing()
+            if not self.user_is_seeking and playing:
                 pos = self.media_player.get_position()
                 if 0 <= pos <= 1:
                     self.seek_var.set(pos * 1000)
+                    self._last_pos_set = pos
         except:
             pass
 
-        self.root.after(100, self.update_seek_bar)
+        # Nothing moves while paused or stopped, so poll slowly
+        self.root.after(100 if playing else 500, self.update_seek_bar)
 
     # ---------------- END SEEKING ---------------- #
 
@@ -189,13 +229,16 @@ class VideoReviewer:
         if not os.path.exists(self.deleted_folder):
             os.makedirs(self.deleted_folder, exist_ok=True)
 
-        exts = (".mp4", ".avi", ".mov", ".mkv", ".wmv", ".flv", ".webm")
-        self.video_paths = [
-            os.path.join(self.folder, f)
-            for f in os.listdir(self.folder)
-            if f.lower().endswith(exts)
-        ]
-        self.video_paths.sort(key=str.lower)
+        exts = {".mp4", ".avi", ".mov", ".mkv", ".wmv", ".flv", ".webm"}
+        with os.scandir(self.folder) as it:
+            self.video_paths = [
+                e.path
+                for e in it
+                if e.is_file(follow_symlinks=False) and os.path.splitext(e.name)[1].lower() in exts
+            ]
+        self.video_paths.sort(key=str.casefold)
+        self._basenames = [os.path.basename(p) for p in self.video_paths]
+        self._deleted_paths = [os.path.join(self.deleted_folder, b) for b in self._basenames]
 
         if not self.video_paths:
             self.overlay_label.config(text="No videos found in this folder!", fg="red")
@@ -207,7 +250,14 @@ class VideoReviewer:
         self.root.lift()
         self.root.focus_force()
 
+    def _ensure_vlc(self):
+        """Create the VLC instance and player on first use."""
+        if self.media_player is None:
+            self.vlc_instance = vlc.Instance()
+            self.media_player = self.vlc_instance.media_player_new()
+
     def attach_player_to_widget(self):
+        self._ensure_vlc()
         self.root.update_idletasks()
         self.root.update()
 
@@ -223,6 +273,7 @@ class VideoReviewer:
             print("Could not attach VLC output:", e)
 
     def show_video(self):
+        self._ensure_vlc()
         try:
             self.media_player.stop()
         except:
@@ -234,7 +285,7 @@ class VideoReviewer:
             return
 
         path = self.video_paths[self.index]
-        basename = os.path.basename(path)
+        basename = self._basenames[self.index]
 
         self.overlay_label.config(text=basename, fg="white")
 
@@ -246,6 +297,7 @@ class VideoReviewer:
 
         # Reset seek bar to zero
         self.seek_var.set(0)
+        self._last_pos_set = -1
 
         self.root.after(600, lambda: self.overlay_label.config(text=""))
 
@@ -259,18 +311,22 @@ class VideoReviewer:
             pass
 
         original_path = self.video_paths[self.index]
-        basename = os.path.basename(original_path)
-        deleted_path = os.path.join(self.deleted_folder, basename)
+        deleted_path = self._deleted_paths[self.index]
 
         try:
-            os.rename(original_path, deleted_path)
-            self.history.append(("delete", deleted_path, original_path, self.index))
+            deleted_path = self.move_to_deleted(original_path, deleted_path)
+            self._hist_kind.append(1)
+            self._hist_src.append(original_path)
+            self._hist_dst.append(deleted_path)
+            self._hist_idx.append(self.index)
             self.deleted_count += 1
         except Exception as e:
             messagebox.showerror("Error", f"Could not move file: {e}")
             return "break"
 
         del self.video_paths[self.index]
+        del self._basenames[self.index]
+        del self._deleted_paths[self.index]
 
         if self.index >= len(self.video_paths):
             self.index = max(0, len(self.video_paths))
@@ -279,6 +335,15 @@ class VideoReviewer:
         self.update_stats()
         return "break"
 
+    @staticmethod
+    def move_to_deleted(src, dst):
+        """Move src into _deleted without clobbering a same-named file; returns the final path."""
+        if os.path.exists(dst):
+            stem, ext = os.path.splitext(dst)
+            dst = f"{stem}_{int(time.time() * 1000)}{ext}"
+        os.replace(src, dst)
+        return dst
+
     def keep_video(self, event=None):
         if self.index >= len(self.video_paths):
             return "break"
@@ -289,7 +354,10 @@ class VideoReviewer:
             pass
 
         path = self.video_paths[self.index]
-        self.history.append(("keep", path, self.index))
+        self._hist_kind.append(0)
+        self._hist_src.append(path)
+        self._hist_dst.append(None)
+        self._hist_idx.append(self.index)
         self.kept_count += 1
 
         self.index += 1
@@ -301,6 +369,7 @@ class VideoReviewer:
         if self.index >= len(self.video_paths):
             return "break"
 
+        self._ensure_vlc()
         try:
             if self.media_player.is_playing():
                 self.media_player.pause()
@@ -334,7 +403,7 @@ class VideoReviewer:
         return "break"
 
     def go_back(self, event=None):
-        if not self.history:
+        if not self._hist_kind:
             return "break"
 
         try:
@@ -342,37 +411,44 @@ class VideoReviewer:
         except:
             pass
 
-        action = self.history.pop()
+        kind = self._hist_kind.pop()
+        original_path = self._hist_src.pop()
+        deleted_path = self._hist_dst.pop()
+        prev_index = self._hist_idx.pop()
 
-        if action[0] == "delete":
-            _, deleted_path, original_path, prev_index = action
+        if kind == 1:
             try:
-                os.rename(deleted_path, original_path)
+                os.replace(deleted_path, original_path)
             except Exception as e:
                 messagebox.showerror("Error", f"Could not restore file: {e}")
                 return "break"
 
             insert_index = min(prev_index, len(self.video_paths))
-            self.video_paths.insert(insert_index, original_path)
+            self._insert_path(insert_index, original_path)
             self.index = insert_index
             self.deleted_count -= 1
 
         else:
-            _, path, prev_index = action
             self.kept_count -= 1
 
             try:
-                pos = self.video_paths.index(path)
+                pos = self.video_paths.index(original_path)
                 self.index = pos
             except ValueError:
                 insert_index = min(prev_index, len(self.video_paths))
-                self.video_paths.insert(insert_index, path)
+                self._insert_path(insert_index, original_path)
                 self.index = insert_index
 
         self.show_video()
         self.update_stats()
         return "break"
 
+    def _insert_path(self, index, path):
+        basename = os.path.basename(path)
+        self.video_paths.insert(index, path)
+        self._basenames.insert(index, basename)
+        self._deleted_paths.insert(index, os.path.join(self.deleted_folder, basename))
+
     def update_stats(self):
         remaining = max(0, len(self.video_paths) - self.index)
         self.stats_label.config(
@@ -385,7 +461,7 @@ class VideoReviewer:
         except:
             pass
 
-        if self.deleted_folder and os.path.exists(self.deleted_folder) and os.listdir(self.deleted_folder):
+        if self.deleted_folder and os.path.exists(self.deleted_folder) and _is_nonempty(self.deleted_folder):
             if messagebox.askyesno("Permanently Delete", "Delete the _deleted folder permanently?"):
                 try:
                     shutil.rmtree(self.deleted_folder)